@@ -1,11 +1,137 @@
+import argparse
+import bisect
+import functools
+import heapq
+import itertools
 import json
+import operator
 import os
+import re
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
+
+import numpy as np
 from typing import Dict, List, Any
 from document_processor import DocumentProcessor
 from persona_analyzer import PersonaAnalyzer
 
+try:
+    import orjson
+    HAVE_ORJSON = True
+except ImportError:
+    HAVE_ORJSON = False
+
+try:
+    import simdjson
+    HAVE_SIMDJSON = True
+except ImportError:
+    HAVE_SIMDJSON = False
+
+try:
+    import ahocorasick
+    HAVE_AHOCORASICK = True
+except ImportError:
+    HAVE_AHOCORASICK = False
+
+# Page markers as emitted by DocumentProcessor, e.g. "--- Page 12 ---"
+_PAGE_RE = re.compile(r'---\s*Page\s*(\d+)\s*---')
+
+# Whitespace normalization: _WS_NEED cheaply detects text that needs the
+# rebuild so the common pre-cleaned extract skips it entirely
+_WS_RE = re.compile(r'\s+')
+_WS_NEED = re.compile(r'\s\s|[\n\t\r]|^\s|\s$')
+
+
+def _normalize_ws(text: str) -> str:
+    """Collapse runs of whitespace to single spaces, skipping clean text."""
+    if _WS_NEED.search(text):
+        return _WS_RE.sub(' ', text).strip()
+    return text
+
+
+@functools.lru_cache(maxsize=4096)
+def _clean_and_structure(content: str) -> str:
+    """Normalize whitespace and truncate long text at a sentence boundary.
+
+    Pure function of the content string, so results are memoized; the same
+    section text routinely comes through more than once per run.
+    """
+    if not content:
+        return ""
+
+    # Remove excessive whitespace; skip the rebuild when already clean
+    content = _normalize_ws(content)
+
+    # If content is too long, truncate at the last sentence boundary
+    if len(content) > 800:
+        cut = content.rfind('. ', 0, 750)
+        content = content[:cut + 1] if cut > 0 else content[:750] + '.'
+
+    return content
+
+
+@functools.lru_cache(maxsize=256)
+def _keyword_automaton(kws: tuple):
+    """Build an Aho-Corasick automaton for a keyword tuple (cached per title).
+
+    One linear scan per extract then replaces the per-keyword substring
+    searches; returns None when pyahocorasick is unavailable.
+    """
+    if not HAVE_AHOCORASICK:
+        return None
+    automaton = ahocorasick.Automaton()
+    for k in kws:
+        automaton.add_word(k, k)
+    automaton.make_automaton()
+    return automaton
+
+
+@functools.lru_cache(maxsize=16)
+def _get_analyzer(role: str, task: str, output_folder: str) -> PersonaAnalyzer:
+    """Return a cached PersonaAnalyzer for this persona/task/output triple.
+
+    Construction derives the analysis patterns from the persona, and the
+    analyzer keeps no per-run state, so repeated challenges with the same
+    persona reuse one instance.
+    """
+    return PersonaAnalyzer(role, task, output_folder)
+
+
+def load_challenge_input(path) -> Dict[str, Any]:
+    """Load a challenge input file, materializing only the fields we use.
+
+    With pysimdjson installed the file is parsed on demand and just the
+    challenge_info block, document filenames/titles, persona role and task
+    are converted to Python objects; falls back to stdlib json otherwise.
+    """
+    raw = Path(path).read_bytes()
+    if not HAVE_SIMDJSON:
+        return json.loads(raw)
+
+    doc = simdjson.Parser().parse(raw)
+
+    def field(path, key):
+        # Missing fields yield an empty dict like the stdlib path would,
+        # leaving downstream .get() calls to supply their defaults
+        try:
+            return {key: doc.at_pointer(path)}
+        except KeyError:
+            return {}
+
+    return {
+        'challenge_info': doc.at_pointer('/challenge_info').as_dict()
+        if 'challenge_info' in doc else {},
+        'documents': [
+            {'filename': d['filename'], 'title': d.get('title', '')}
+            for d in doc.at_pointer('/documents')
+        ] if 'documents' in doc else [],
+        'persona': field('/persona/role', 'role'),
+        'job_to_be_done': field('/job_to_be_done/task', 'task'),
+    }
+
+
 class PersonaDocumentIntelligenceSystem:
     """
     Main system that coordinates document processing and persona-driven analysis.
@@ -18,7 +144,10 @@ class PersonaDocumentIntelligenceSystem:
         self.output_folder.mkdir(parents=True, exist_ok=True)
         
         self.document_processor = DocumentProcessor(input_folder, output_folder)
-        
+        # Filename -> processed document map, rebuilt per challenge run so
+        # later lookups are O(1) instead of scanning the document list
+        self._doc_index = {}
+
     def process_challenge_input(self, input_data: Dict[str, Any]) -> Dict[str, Any]:
         """
         Process input in the challenge format and return structured output.
@@ -32,8 +161,13 @@ class PersonaDocumentIntelligenceSystem:
         # Initialize persona analyzer
         persona_role = persona_info.get('role', 'Generic Analyst')
         job_task = job_info.get('task', 'Analyze documents for insights')
-        
-        persona_analyzer = PersonaAnalyzer(persona_role, job_task, str(self.output_folder))
+
+        # One timestamp per run, shared by metadata and output filenames
+        now = datetime.now()
+        run_iso = now.isoformat()
+        run_stamp = now.strftime("%Y%m%d_%H%M%S")
+
+        persona_analyzer = _get_analyzer(persona_role, job_task, str(self.output_folder))
         
         print(f"🎯 Challenge: {challenge_info.get('description', 'Document Analysis')}")
         print(f"👤 Persona: {persona_role}")
@@ -43,7 +177,18 @@ class PersonaDocumentIntelligenceSystem:
         
         # Process documents
         processed_documents = self.document_processor.process_all_documents()
-        
+        # Intern filenames so every later dict lookup and == compares by
+        # pointer against the canonical string
+        self._doc_index = {}
+        for doc in processed_documents:
+            metadata = doc.get('metadata', {})
+            fn = sys.intern(metadata.get('filename', ''))
+            metadata['filename'] = fn
+            self._doc_index[fn] = doc
+        for doc_info in documents_info:
+            if 'filename' in doc_info:
+                doc_info['filename'] = sys.intern(doc_info['filename'])
+
         # Filter documents to match input list
         relevant_documents = self.filter_relevant_documents(processed_documents, documents_info)
         
@@ -52,38 +197,62 @@ class PersonaDocumentIntelligenceSystem:
         
         # Generate challenge-format output
         output_data = self.generate_challenge_output(
-            challenge_info, documents_info, persona_info, job_info, 
-            relevant_documents, analysis_results
+            challenge_info, documents_info, persona_info, job_info,
+            relevant_documents, analysis_results, run_iso=run_iso
         )
-        
+
         # Save output
-        self.save_challenge_output(output_data, challenge_info.get('challenge_id', 'unknown'))
+        self.save_challenge_output(output_data, challenge_info.get('challenge_id', 'unknown'),
+                                   run_stamp=run_stamp)
         
         return output_data
     
+    def build_page_index(self, doc: Dict) -> tuple:
+        """Build (and cache on the doc) sorted offset/page lists for its page markers.
+
+        One linear pass over raw_content replaces the per-extract find/count
+        rescans; lookups then bisect into the offsets.
+        """
+        cached = doc.get('_page_index')
+        if cached is not None:
+            return cached
+
+        raw_content = doc.get('raw_content', '')
+        offsets = []
+        pages = []
+        for match in _PAGE_RE.finditer(raw_content):
+            offsets.append(match.start())
+            pages.append(int(match.group(1)))
+
+        doc['_page_index'] = (offsets, pages)
+        return offsets, pages
+
+    def page_number_at(self, doc: Dict, pos: int) -> int:
+        """Return the page number covering a character offset in raw_content."""
+        offsets, pages = self.build_page_index(doc)
+        idx = bisect.bisect_right(offsets, pos) - 1
+        return pages[idx] if idx >= 0 else 1
+
     def filter_relevant_documents(self, processed_docs: List[Dict], document_info: List[Dict]) -> List[Dict]:
         """Filter processed documents to match the input document list."""
-        relevant_docs = []
-        input_filenames = {doc['filename'] for doc in document_info}
-        
-        for doc in processed_docs:
-            filename = doc.get('metadata', {}).get('filename', '')
-            if filename in input_filenames:
-                relevant_docs.append(doc)
-        
-        return relevant_docs
+        # Drive iteration from the input list against the filename index:
+        # O(M) in the requested documents, and the output order follows the
+        # challenge input rather than directory listing order.
+        return [self._doc_index[d['filename']] for d in document_info
+                if d['filename'] in self._doc_index]
     
-    def generate_challenge_output(self, challenge_info: Dict, documents_info: List[Dict], 
-                                persona_info: Dict, job_info: Dict, 
-                                processed_docs: List[Dict], analysis_results: Dict) -> Dict[str, Any]:
+    def generate_challenge_output(self, challenge_info: Dict, documents_info: List[Dict],
+                                persona_info: Dict, job_info: Dict,
+                                processed_docs: List[Dict], analysis_results: Dict,
+                                run_iso: str = None) -> Dict[str, Any]:
         """Generate output in the expected challenge format."""
-        
+
         # Create metadata section
         metadata = {
             "input_documents": [doc['filename'] for doc in documents_info],
             "persona": persona_info.get('role', 'Unknown'),
             "job_to_be_done": job_info.get('task', 'Unknown'),
-            "processing_timestamp": datetime.now().isoformat()
+            "processing_timestamp": run_iso or datetime.now().isoformat()
         }
         
         # Extract key sections based on persona analysis
@@ -111,37 +280,40 @@ class PersonaDocumentIntelligenceSystem:
         # Create a mapping of filename to analysis
         analysis_map = {analysis['filename']: analysis for analysis in document_analyses}
         
-        section_candidates = []
-        
-        # Collect all relevant sections from all documents
-        for doc in processed_docs:
-            filename = doc.get('metadata', {}).get('filename', '')
-            sections = doc.get('sections', [])
-            doc_analysis = analysis_map.get(filename, {})
-            relevant_sections = doc_analysis.get('relevant_sections', [])
-            
-            # Add sections with relevance scores
-            for section in relevant_sections:
-                section_candidates.append({
-                    'document': filename,
-                    'section_title': section.get('title', 'Untitled Section'),
-                    'relevance_score': section.get('relevance_score', 0),
-                    'page_number': self.estimate_page_number(section),
-                    'content': section.get('content', '')
-                })
-        
-        # Sort by relevance score and take top sections
-        section_candidates.sort(key=lambda x: x['relevance_score'], reverse=True)
-        
-        # Format as expected output (top 5 sections)
-        for i, section in enumerate(section_candidates[:5]):
+        # Collect all relevant sections as lean (score, document, title,
+        # start_line) tuples -- no per-candidate dict, no content copy
+        section_candidates = [
+            (section.get('relevance_score', 0),
+             doc.get('metadata', {}).get('filename', ''),
+             section.get('title', 'Untitled Section'),
+             section.get('start_line', 0))
+            for doc in processed_docs
+            for section in analysis_map.get(
+                doc.get('metadata', {}).get('filename', ''), {}).get('relevant_sections', [])
+        ]
+
+        # Top 5 by relevance score; nlargest avoids sorting the full list
+        top_sections = heapq.nlargest(5, section_candidates,
+                                      key=operator.itemgetter(0))
+
+        if not top_sections:
+            return key_sections
+
+        # Estimate the winners' page numbers in one vectorized pass
+        # (~50 lines/page, capped at 20)
+        starts = np.fromiter((c[3] for c in top_sections),
+                             dtype=np.int32, count=len(top_sections))
+        pages = np.clip(starts // 50 + 1, 1, 20)
+
+        # Build output dicts only for the top 5 sections
+        for i, ((_, document, title, _), page) in enumerate(zip(top_sections, pages)):
             key_sections.append({
-                "document": section['document'],
-                "section_title": section['section_title'],
+                "document": document,
+                "section_title": title,
                 "importance_rank": i + 1,
-                "page_number": section['page_number']
+                "page_number": int(page)
             })
-        
+
         return key_sections
     
     def generate_subsection_analysis(self, processed_docs: List[Dict], analysis_results: Dict) -> List[Dict]:
@@ -160,20 +332,36 @@ class PersonaDocumentIntelligenceSystem:
             filename = doc.get('metadata', {}).get('filename', '')
             doc_analysis = analysis_map.get(filename, {})
             key_extracts = doc_analysis.get('key_extracts', [])
-            
+
             # Get the most relevant sections for detailed analysis
             relevant_sections = doc_analysis.get('relevant_sections', [])[:3]  # Top 3 sections per doc
-            
+
             for section in relevant_sections:
                 refined_text = self.create_refined_text(section, key_extracts)
                 if refined_text:  # Only add if we have meaningful content
                     subsection_analysis.append({
                         "document": filename,
                         "refined_text": refined_text,
-                        "page_number": self.estimate_page_number(section)
+                        "page_number": self.locate_section_page(doc, section)
                     })
-        
+
         return subsection_analysis
+
+    def locate_section_page(self, doc: Dict, section: Dict) -> int:
+        """Resolve a section's page from the raw page markers when possible.
+
+        Falls back to the line-count heuristic when the section content
+        cannot be found in the document's raw text.
+        """
+        content = section.get('content', '')
+        if content:
+            # Search on a short prefix; full section bodies may span cleaned
+            # whitespace and fail an exact match
+            probe = content[:80]
+            pos = doc.get('raw_content', '').find(probe)
+            if pos != -1:
+                return self.page_number_at(doc, pos)
+        return self.estimate_page_number(section)
     
     def create_refined_text(self, section: Dict, key_extracts: List[str]) -> str:
         """Create refined, persona-relevant text from section content."""
@@ -182,17 +370,21 @@ class PersonaDocumentIntelligenceSystem:
         
         # If section content is too short, try to enhance with key extracts
         if len(section_content) < 100:
-            # Find relevant extracts that might belong to this section
-            relevant_extracts = []
-            title_keywords = section_title.lower().split()
-            
-            for extract in key_extracts:
-                extract_lower = extract.lower()
-                if any(keyword in extract_lower for keyword in title_keywords if len(keyword) > 3):
-                    relevant_extracts.append(extract)
-            
-            if relevant_extracts:
-                section_content = ' '.join(relevant_extracts[:3])
+            # Filter the title keywords once; only three extracts are ever used
+            kws = tuple(k for k in section_title.lower().split() if len(k) > 3)
+            if kws:
+                automaton = _keyword_automaton(tuple(sorted(kws)))
+                if automaton is not None:
+                    matches = (e for e in key_extracts
+                               if next(automaton.iter(e.lower()), None) is not None)
+                else:
+                    matches = (e for e in key_extracts
+                               if any(k in e.lower() for k in kws))
+                # Lazily take at most three matches; nothing is allocated
+                # when no extract matches
+                picked = list(itertools.islice(matches, 3))
+                if picked:
+                    section_content = ' '.join(picked)
         
         # Clean and refine the text
         refined_text = self.clean_and_structure_text(section_content, section_title)
@@ -201,30 +393,7 @@ class PersonaDocumentIntelligenceSystem:
     
     def clean_and_structure_text(self, content: str, title: str) -> str:
         """Clean and structure text for better readability."""
-        if not content:
-            return ""
-        
-        # Remove excessive whitespace
-        content = ' '.join(content.split())
-        
-        # If content is too long, truncate intelligently
-        if len(content) > 800:
-            sentences = content.split('. ')
-            truncated_sentences = []
-            char_count = 0
-            
-            for sentence in sentences:
-                if char_count + len(sentence) < 750:
-                    truncated_sentences.append(sentence)
-                    char_count += len(sentence)
-                else:
-                    break
-            
-            content = '. '.join(truncated_sentences)
-            if not content.endswith('.'):
-                content += '.'
-        
-        return content
+        return _clean_and_structure(content)
     
     def estimate_page_number(self, section: Dict) -> int:
         """Estimate page number for a section (placeholder logic)."""
@@ -234,19 +403,31 @@ class PersonaDocumentIntelligenceSystem:
         estimated_page = max(1, (start_line // 50) + 1)  # Assume ~50 lines per page
         return min(estimated_page, 20)  # Cap at reasonable page number
     
-    def save_challenge_output(self, output_data: Dict[str, Any], challenge_id: str):
+    def save_challenge_output(self, output_data: Dict[str, Any], challenge_id: str,
+                              run_stamp: str = None):
         """Save the challenge output to a JSON file."""
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        timestamp = run_stamp or datetime.now().strftime("%Y%m%d_%H%M%S")
         output_filename = f"challenge_output_{challenge_id}_{timestamp}.json"
         output_path = self.output_folder / output_filename
-        
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(output_data, f, indent=4, ensure_ascii=False)
-        
+
+        def write_json():
+            if HAVE_ORJSON:
+                # orjson serializes in C and writes UTF-8 bytes directly
+                output_path.write_bytes(orjson.dumps(output_data, option=orjson.OPT_INDENT_2))
+            else:
+                with open(output_path, 'w', encoding='utf-8') as f:
+                    json.dump(output_data, f, indent=4, ensure_ascii=False)
+
+        # JSON and summary are independent writes; overlap them so the GIL
+        # is released during the file I/O of one while the other formats
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            json_future = pool.submit(write_json)
+            summary_future = pool.submit(self.save_readable_summary,
+                                         output_data, challenge_id, timestamp)
+            json_future.result()
+            summary_future.result()
+
         print(f"\n✅ Challenge output saved to: {output_path}")
-        
-        # Also save a readable summary
-        self.save_readable_summary(output_data, challenge_id, timestamp)
     
     def save_readable_summary(self, output_data: Dict, challenge_id: str, timestamp: str):
         """Save a human-readable summary of the results."""
@@ -257,209 +438,57 @@ class PersonaDocumentIntelligenceSystem:
         sections = output_data.get('extracted_sections', [])
         subsections = output_data.get('subsection_analysis', [])
         
-        with open(summary_path, 'w', encoding='utf-8') as f:
-            f.write("=" * 60 + "\n")
-            f.write("PERSONA-DRIVEN DOCUMENT INTELLIGENCE RESULTS\n")
-            f.write("=" * 60 + "\n\n")
-            
-            f.write("METADATA:\n")
-            f.write("-" * 20 + "\n")
-            f.write(f"Persona: {metadata.get('persona', 'Unknown')}\n")
-            f.write(f"Task: {metadata.get('job_to_be_done', 'Unknown')}\n")
-            f.write(f"Documents: {len(metadata.get('input_documents', []))}\n")
-            f.write(f"Processing Time: {metadata.get('processing_timestamp', 'Unknown')}\n\n")
-            
-            f.write("KEY EXTRACTED SECTIONS:\n")
-            f.write("-" * 30 + "\n")
-            for section in sections:
-                f.write(f"{section.get('importance_rank', 0)}. {section.get('section_title', 'Untitled')}\n")
-                f.write(f"   Document: {section.get('document', 'Unknown')}\n")
-                f.write(f"   Page: {section.get('page_number', 'Unknown')}\n\n")
-            
-            f.write("DETAILED SUBSECTION ANALYSIS:\n")
-            f.write("-" * 35 + "\n")
-            for i, subsection in enumerate(subsections, 1):
-                f.write(f"{i}. Document: {subsection.get('document', 'Unknown')}\n")
-                f.write(f"   Page: {subsection.get('page_number', 'Unknown')}\n")
-                f.write(f"   Content Preview: {subsection.get('refined_text', '')[:200]}...\n\n")
-        
+        # Build the whole summary in memory and flush it in one write
+        parts = [
+            "=" * 60 + "\n",
+            "PERSONA-DRIVEN DOCUMENT INTELLIGENCE RESULTS\n",
+            "=" * 60 + "\n\n",
+            "METADATA:\n",
+            "-" * 20 + "\n",
+            f"Persona: {metadata.get('persona', 'Unknown')}\n",
+            f"Task: {metadata.get('job_to_be_done', 'Unknown')}\n",
+            f"Documents: {len(metadata.get('input_documents', []))}\n",
+            f"Processing Time: {metadata.get('processing_timestamp', 'Unknown')}\n\n",
+            "KEY EXTRACTED SECTIONS:\n",
+            "-" * 30 + "\n",
+        ]
+        parts.extend(
+            f"{section.get('importance_rank', 0)}. {section.get('section_title', 'Untitled')}\n"
+            f"   Document: {section.get('document', 'Unknown')}\n"
+            f"   Page: {section.get('page_number', 'Unknown')}\n\n"
+            for section in sections
+        )
+        parts.append("DETAILED SUBSECTION ANALYSIS:\n")
+        parts.append("-" * 35 + "\n")
+        parts.extend(
+            f"{i}. Document: {subsection.get('document', 'Unknown')}\n"
+            f"   Page: {subsection.get('page_number', 'Unknown')}\n"
+            f"   Content Preview: {subsection.get('refined_text', '')[:200]}...\n\n"
+            for i, subsection in enumerate(subsections, 1)
+        )
+        summary_path.write_text(''.join(parts), encoding='utf-8')
+
         print(f"📄 Readable summary saved to: {summary_path}")
 
-def main():
+def main(argv=None):
     """Main function to run the persona-driven document intelligence system."""
-    system = PersonaDocumentIntelligenceSystem()
-    
-    # Example of how to use with challenge input format
-    sample_input = {
-        "challenge_info": {
-            "challenge_id": "round_1b_002",
-            "test_case_name": "travel_planner",
-            "description": "France Travel"
-        },
-        "documents": [
-            {"filename": "South of France - Cities.pdf", "title": "South of France - Cities"},
-            {"filename": "South of France - Cuisine.pdf", "title": "South of France - Cuisine"},
-            {"filename": "South of France - History.pdf", "title": "South of France - History"},
-            {"filename": "South of France - Restaurants and Hotels.pdf", "title": "South of France - Restaurants and Hotels"},
-            {"filename": "South of France - Things to Do.pdf", "title": "South of France - Things to Do"},
-            {"filename": "South of France - Tips and Tricks.pdf", "title": "South of France - Tips and Tricks"},
-            {"filename": "South of France - Traditions and Culture.pdf", "title": "South of France - Traditions and Culture"}
-        ],
-        "persona": {
-            "role": "Travel Planner"
-        },
-        "job_to_be_done": {
-            "task": "Plan a trip of 4 days for a group of 10 college friends."
-        }
-    }
-def extract_key_sections(self, processed_docs: List[Dict], analysis_results: Dict) -> List[Dict]:
-    """Extract key sections ranked by importance for the persona."""
-    extracted_sections = []
-    
-    # Get document analyses from persona analyzer results
-    doc_analyses = analysis_results.get('document_analyses', [])
-    
-    for idx, doc_analysis in enumerate(doc_analyses, 1):
-        filename = doc_analysis.get('filename', 'Unknown')
-        relevance_score = doc_analysis.get('relevance_score', 0.0)
-        key_extracts = doc_analysis.get('key_extracts', [])
-        
-        # Create section title based on first key extract or filename
-        if key_extracts:
-            section_title = key_extracts[0][:50] + "..." if len(key_extracts[0]) > 50 else key_extracts[0]
-        else:
-            # Fallback: create title from filename
-            section_title = filename.replace('.pdf', '').replace('-', ' ').title()
-        
-        # Find the document to get page info
-        page_number = 1  # Default
-        for doc in processed_docs:
-            if doc.get('metadata', {}).get('filename') == filename:
-                # Try to extract page from first content or default to 1
-                raw_content = doc.get('raw_content', '')
-                if '--- Page' in raw_content:
-                    try:
-                        page_start = raw_content.find('--- Page') + 9
-                        page_end = raw_content.find('---', page_start)
-                        page_number = int(raw_content[page_start:page_end].strip())
-                    except:
-                        page_number = 1
-                break
-        
-        extracted_sections.append({
-            "document": filename,
-            "section_title": section_title,
-            "importance_rank": idx,  # Based on relevance order
-            "page_number": page_number
-        })
-    
-    # Sort by relevance score (higher scores first)
-    extracted_sections.sort(key=lambda x: doc_analyses[x['importance_rank']-1].get('relevance_score', 0), reverse=True)
-    
-    # Re-assign ranks after sorting
-    for idx, section in enumerate(extracted_sections, 1):
-        section['importance_rank'] = idx
-    
-    return extracted_sections[:5]  # Return top 5 sections
-
-def generate_subsection_analysis(self, processed_docs: List[Dict], analysis_results: Dict) -> List[Dict]:
-    """Generate detailed subsection analysis with refined text."""
-    subsection_analysis = []
-    
-    # Get persona-specific extracts
-    persona_extracts = analysis_results.get('persona_specific_extracts', [])
-    doc_analyses = analysis_results.get('document_analyses', [])
-    
-    for doc_analysis in doc_analyses:
-        filename = doc_analysis.get('filename', 'Unknown')
-        key_extracts = doc_analysis.get('key_extracts', [])
-        
-        # Find the corresponding processed document
-        doc_content = ""
-        for doc in processed_docs:
-            if doc.get('metadata', {}).get('filename') == filename:
-                doc_content = doc.get('raw_content', doc.get('content', ''))
-                break
-        
-        # Extract refined text from key extracts
-        for extract in key_extracts[:2]:  # Limit to first 2 extracts per document
-            # Find page number for this extract
-            page_number = 1
-            if '--- Page' in doc_content and extract in doc_content:
-                extract_pos = doc_content.find(extract)
-                page_section = doc_content[:extract_pos]
-                page_matches = page_section.count('--- Page')
-                page_number = max(1, page_matches)
-            
-            # Clean and refine the text
-            refined_text = self.refine_text_for_persona(extract, analysis_results.get('persona', ''))
-            
-            subsection_analysis.append({
-                "document": filename,
-                "refined_text": refined_text,
-                "page_number": page_number
-            })
-    
-    return subsection_analysis
+    parser = argparse.ArgumentParser(
+        description="Run persona-driven document intelligence on a challenge input file.")
+    parser.add_argument('--input', default='data/samples/travel_planner.json',
+                        help='Path to a challenge input JSON file')
+    parser.add_argument('--input-folder', default='data/input',
+                        help='Folder containing the PDF documents')
+    parser.add_argument('--output-folder', default='data/output',
+                        help='Folder to write challenge output into')
+    args = parser.parse_args(argv)
 
-def refine_text_for_persona(self, text: str, persona: str) -> str:
-    """Refine text content to be more relevant for the specific persona."""
-    # Clean up text
-    refined = text.strip()
-    
-    # Remove extra whitespace and clean formatting
-    refined = ' '.join(refined.split())
-    
-    # Truncate if too long (keep it manageable)
-    if len(refined) > 500:
-        refined = refined[:500] + "..."
-    
-    return refined
+    system = PersonaDocumentIntelligenceSystem(args.input_folder, args.output_folder)
 
-def save_challenge_output(self, output_data: Dict[str, Any], challenge_id: str):
-    """Save the challenge output to files."""
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    
-    # Save JSON output
-    json_filename = f"challenge_output_{challenge_id}_{timestamp}.json"
-    json_path = self.output_folder / json_filename
-    
-    with open(json_path, 'w', encoding='utf-8') as f:
-        json.dump(output_data, f, indent=4, ensure_ascii=False)
-    
-    # Save readable summary
-    summary_filename = f"challenge_summary_{challenge_id}_{timestamp}.txt"
-    summary_path = self.output_folder / summary_filename
-    
-    with open(summary_path, 'w', encoding='utf-8') as f:
-        f.write("=" * 60 + "\n")
-        f.write("PERSONA-DRIVEN DOCUMENT INTELLIGENCE RESULTS\n")
-        f.write("=" * 60 + "\n")
-        f.write(f"Challenge ID: {challenge_id}\n")
-        f.write(f"Persona: {output_data['metadata']['persona']}\n")
-        f.write(f"Task: {output_data['metadata']['job_to_be_done']}\n")
-        f.write(f"Documents: {len(output_data['metadata']['input_documents'])}\n")
-        f.write(f"Processing Time: {output_data['metadata']['processing_timestamp']}\n\n")
-        
-        f.write("KEY EXTRACTED SECTIONS:\n")
-        f.write("-" * 30 + "\n")
-        for section in output_data['extracted_sections']:
-            f.write(f"Rank {section['importance_rank']}: {section['section_title']}\n")
-            f.write(f"Document: {section['document']} (Page {section['page_number']})\n\n")
-        
-        f.write("DETAILED SUBSECTION ANALYSIS:\n")
-        f.write("-" * 35 + "\n")
-        for analysis in output_data['subsection_analysis']:
-            f.write(f"Document: {analysis['document']} (Page {analysis['page_number']})\n")
-            f.write(f"Content: {analysis['refined_text'][:200]}...\n\n")
-    
-    print(f"✅ Challenge output saved to: {json_path}")
-    print(f"📄 Readable summary saved to: {summary_path}")
-    
     # Process the input
-    results = system.process_challenge_input(sample_input)
-    
+    input_data = load_challenge_input(args.input)
+    results = system.process_challenge_input(input_data)
+
     return results
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
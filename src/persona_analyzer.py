@@ -1,9 +1,229 @@
 import json
+import multiprocessing as mp
+import os
 import re
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
 from typing import List, Dict, Any, Tuple
 from datetime import datetime
 from pathlib import Path
 
+import numpy as np
+
+try:
+    from numba import njit, types
+    HAVE_NUMBA = True
+except ImportError:
+    HAVE_NUMBA = False
+
+try:
+    import orjson
+    HAVE_ORJSON = True
+except ImportError:
+    HAVE_ORJSON = False
+
+try:
+    import ahocorasick
+    HAVE_AHOCORASICK = True
+except ImportError:
+    HAVE_AHOCORASICK = False
+
+# Below this many characters the interpreter loop wins over kernel setup
+_NUMBA_MIN_TEXT = 5000
+
+# One-pass casefold + tokenize prep: lowercases ASCII letters and blanks out
+# ASCII punctuation, so word tokens fall out of a plain .split()
+_NORM_TABLE = str.maketrans({
+    **{chr(c): chr(c + 32) for c in range(65, 91)},
+    **{chr(c): ' ' for c in range(128) if not chr(c).isalnum()},
+})
+
+# Persona patterns and category keywords are fixed tables; built once at
+# import instead of per __init__ / per matches_category call
+_PATTERNS = {
+    'travel_content_writer': {
+        'key_sections': ['attractions', 'cuisine', 'culture', 'hotels', 'restaurants', 'tips', 'history', 'traditions'],
+        'extraction_keywords': ['visit', 'taste', 'experience', 'stay', 'eat', 'see', 'do', 'recommend', 'must', 'best', 'top'],
+        'format_preferences': ['detailed descriptions', 'practical information', 'insider tips', 'cultural context'],
+        'output_structure': ['overview', 'attractions', 'dining', 'culture', 'practical_tips']
+    },
+    'researcher': {
+        'key_sections': ['methodology', 'results', 'conclusions', 'references', 'data', 'analysis'],
+        'extraction_keywords': ['study', 'research', 'method', 'result', 'conclusion', 'data', 'analysis', 'finding'],
+        'format_preferences': ['citations', 'methodologies', 'key findings', 'data points'],
+        'output_structure': ['literature_review', 'methodologies', 'key_findings', 'references']
+    },
+    'analyst': {
+        'key_sections': ['trends', 'metrics', 'performance', 'market', 'revenue', 'growth'],
+        'extraction_keywords': ['trend', 'increase', 'decrease', 'percent', 'growth', 'market', 'revenue', 'profit'],
+        'format_preferences': ['quantitative data', 'trends', 'comparisons', 'forecasts'],
+        'output_structure': ['executive_summary', 'key_metrics', 'trends', 'recommendations']
+    },
+    'student': {
+        'key_sections': ['concepts', 'definitions', 'examples', 'formulas', 'principles'],
+        'extraction_keywords': ['define', 'concept', 'principle', 'formula', 'example', 'important', 'key'],
+        'format_preferences': ['clear definitions', 'examples', 'step-by-step', 'summaries'],
+        'output_structure': ['key_concepts', 'definitions', 'examples', 'study_notes']
+    },
+    'default': {
+        'key_sections': ['overview', 'main_points', 'details', 'summary'],
+        'extraction_keywords': ['important', 'key', 'main', 'significant', 'notable'],
+        'format_preferences': ['organized information', 'clear structure', 'relevant details'],
+        'output_structure': ['overview', 'main_points', 'details', 'summary']
+    }
+}
+
+_CATEGORY_KEYWORDS = {
+    'overview': ('overview', 'introduction', 'about', 'general'),
+    'attractions': ('attraction', 'visit', 'see', 'place', 'site', 'landmark'),
+    'dining': ('restaurant', 'food', 'eat', 'cuisine', 'dining', 'taste'),
+    'culture': ('culture', 'tradition', 'history', 'local', 'heritage'),
+    'practical_tips': ('tip', 'advice', 'recommend', 'should', 'how to'),
+    'main_points': ('important', 'key', 'main', 'primary'),
+    'details': ('detail', 'specific', 'information', 'data'),
+    'summary': ('summary', 'conclusion', 'overview', 'recap')
+}
+
+# Frozenset views for title-token short-circuits: a title token equal to a
+# category keyword guarantees the substring scan over title+content would
+# match, so well-titled sections skip the content scan entirely
+_CATEGORY_KW_SETS = {cat: frozenset(kws) for cat, kws in _CATEGORY_KEYWORDS.items()}
+
+# Compiled once at import; these run inside per-sentence loops where re's
+# internal cache lookup and argument parsing add up
+_SENT_RE = re.compile(r'[.!?]+')
+# Single alternation so the engine walks each sentence once instead of
+# restarting for every action pattern
+_ACTION_RE = re.compile(
+    r'\b(?:should|must|need to|recommended|suggest|advise'
+    r'|visit|try|taste|see|do|avoid|bring|book'
+    r'|tip|advice|recommendation|warning)\b',
+    re.IGNORECASE)
+
+
+if HAVE_NUMBA:
+    # Sentence/keyword buffers come from np.frombuffer and are read-only
+    _RO_BYTES = types.Array(types.uint8, 1, 'C', readonly=True)
+
+    @njit(types.uint8[:](_RO_BYTES, types.int64[:], types.int64[:],
+                         _RO_BYTES, types.int64[:], types.int64[:]),
+          cache=True, boundscheck=False)
+    def _sentence_match_kernel(buf, starts, ends, kw_buf, kw_starts, kw_ends):
+        """Flag sentences containing any keyword, case-insensitively.
+
+        Only valid for ASCII text; the caller guards on content.isascii().
+        Keywords are expected pre-lowercased.
+        """
+        mask = np.zeros(starts.shape[0], dtype=np.uint8)
+        for i in range(starts.shape[0]):
+            s = starts[i]
+            e = ends[i]
+            for k in range(kw_starts.shape[0]):
+                ks = kw_starts[k]
+                klen = kw_ends[k] - ks
+                if klen == 0 or e - s < klen:
+                    continue
+                first = kw_buf[ks]
+                for p in range(s, e - klen + 1):
+                    c = buf[p]
+                    if 65 <= c <= 90:
+                        c += 32
+                    if c == first:
+                        hit = True
+                        for q in range(1, klen):
+                            cc = buf[p + q]
+                            if 65 <= cc <= 90:
+                                cc += 32
+                            if cc != kw_buf[ks + q]:
+                                hit = False
+                                break
+                        if hit:
+                            mask[i] = 1
+                            break
+                if mask[i]:
+                    break
+        return mask
+
+    def _sentence_keyword_mask(sentences, keywords):
+        """Pack sentences and keywords into flat buffers and run the kernel."""
+        def pack(items):
+            lengths = np.fromiter((len(x) for x in items),
+                                  dtype=np.int64, count=len(items))
+            ends = np.cumsum(lengths)
+            starts = ends - lengths
+            buf = np.frombuffer(''.join(items).encode('ascii'), dtype=np.uint8)
+            return buf, starts, ends
+
+        buf, starts, ends = pack(sentences)
+        kw_buf, kw_starts, kw_ends = pack(keywords)
+        return _sentence_match_kernel(buf, starts, ends, kw_buf, kw_starts, kw_ends)
+
+
+# Per-worker analyzer, created once by the pool initializer so each process
+# builds its automata a single time instead of once per document
+_WORKER_ANALYZER = None
+
+
+def _init_analyzer_worker(persona: str, job_to_be_done: str, output_folder: str):
+    global _WORKER_ANALYZER
+    _WORKER_ANALYZER = PersonaAnalyzer(persona, job_to_be_done, output_folder)
+
+
+def _analyze_document_worker(doc: Dict[str, Any]) -> Dict[str, Any]:
+    return _WORKER_ANALYZER.analyze_single_document(doc)
+
+
+def _content_lower_of(doc: Dict[str, Any]) -> str:
+    """Return the document's lowercased content, caching it on the dict.
+
+    Casefolding multi-KB content is a pure byte transform, so every helper
+    shares one copy per document instead of re-lowering it.
+    """
+    content_lower = doc.get('_content_lower')
+    if content_lower is None:
+        content_lower = doc['_content_lower'] = doc.get('content', '').lower()
+    return content_lower
+
+
+def _content_norm_of(doc: Dict[str, Any]) -> str:
+    """Return the document's normalized content, caching it on the dict.
+
+    One translate pass lowercases and strips punctuation together, so
+    tokenization downstream is just .split().
+    """
+    content_norm = doc.get('_content_norm')
+    if content_norm is None:
+        content_norm = doc['_content_norm'] = doc.get('content', '').translate(_NORM_TABLE)
+    return content_norm
+
+
+def _title_tokens_of(section: Dict[str, Any]) -> Tuple[str, ...]:
+    """Return the section title's normalized tokens, caching them on the dict.
+
+    Titles are touched by several helpers (themes, relevant sections,
+    category matching); one tokenization per section serves them all. A
+    frozenset view is cached alongside for membership tests.
+    """
+    tokens = section.get('_title_tokens')
+    if tokens is None:
+        tokens = section['_title_tokens'] = tuple(
+            section.get('title', '').translate(_NORM_TABLE).split())
+        section['_title_set'] = frozenset(tokens)
+    return tokens
+
+
+def _build_automaton(words):
+    """Build an Aho-Corasick automaton over a word list, or None without
+    pyahocorasick; one pass over the text then finds every keyword hit."""
+    if not HAVE_AHOCORASICK or not words:
+        return None
+    automaton = ahocorasick.Automaton()
+    for word in set(words):
+        automaton.add_word(word, word)
+    automaton.make_automaton()
+    return automaton
+
+
 class PersonaAnalyzer:
     """
     Analyzes documents through the lens of a specific persona and job-to-be-done.
@@ -18,52 +238,33 @@ class PersonaAnalyzer:
         
         # Define persona-specific analysis patterns
         self.analysis_patterns = self.define_analysis_patterns()
+
+        # Keyword sets and multi-pattern matchers built once per persona; the
+        # job is fixed for the analyzer's lifetime so its keywords can be
+        # tokenized here too
+        self._job_kw_set = frozenset(self.job_to_be_done.translate(_NORM_TABLE).split())
+        self._persona_kw_set = frozenset(self.analysis_patterns['extraction_keywords'])
+        self._extract_ac = _build_automaton(self.analysis_patterns['extraction_keywords'])
+        self._section_ac = _build_automaton(self.analysis_patterns['key_sections'])
+        self._category_acs = {}
+        self._category_tag_ac = self._build_category_tagger(
+            self.analysis_patterns['output_structure'])
+        # The persona never changes, so the insight dispatch is resolved once
+        # here instead of re-testing the persona string per document
+        self._insight_rules = self._build_insight_rules()
     
     def define_analysis_patterns(self) -> Dict[str, Any]:
         """
         Define analysis patterns based on common persona types.
         This could be expanded with more sophisticated persona matching.
         """
-        patterns = {
-            'travel_content_writer': {
-                'key_sections': ['attractions', 'cuisine', 'culture', 'hotels', 'restaurants', 'tips', 'history', 'traditions'],
-                'extraction_keywords': ['visit', 'taste', 'experience', 'stay', 'eat', 'see', 'do', 'recommend', 'must', 'best', 'top'],
-                'format_preferences': ['detailed descriptions', 'practical information', 'insider tips', 'cultural context'],
-                'output_structure': ['overview', 'attractions', 'dining', 'culture', 'practical_tips']
-            },
-            'researcher': {
-                'key_sections': ['methodology', 'results', 'conclusions', 'references', 'data', 'analysis'],
-                'extraction_keywords': ['study', 'research', 'method', 'result', 'conclusion', 'data', 'analysis', 'finding'],
-                'format_preferences': ['citations', 'methodologies', 'key findings', 'data points'],
-                'output_structure': ['literature_review', 'methodologies', 'key_findings', 'references']
-            },
-            'analyst': {
-                'key_sections': ['trends', 'metrics', 'performance', 'market', 'revenue', 'growth'],
-                'extraction_keywords': ['trend', 'increase', 'decrease', 'percent', 'growth', 'market', 'revenue', 'profit'],
-                'format_preferences': ['quantitative data', 'trends', 'comparisons', 'forecasts'],
-                'output_structure': ['executive_summary', 'key_metrics', 'trends', 'recommendations']
-            },
-            'student': {
-                'key_sections': ['concepts', 'definitions', 'examples', 'formulas', 'principles'],
-                'extraction_keywords': ['define', 'concept', 'principle', 'formula', 'example', 'important', 'key'],
-                'format_preferences': ['clear definitions', 'examples', 'step-by-step', 'summaries'],
-                'output_structure': ['key_concepts', 'definitions', 'examples', 'study_notes']
-            },
-            'default': {
-                'key_sections': ['overview', 'main_points', 'details', 'summary'],
-                'extraction_keywords': ['important', 'key', 'main', 'significant', 'notable'],
-                'format_preferences': ['organized information', 'clear structure', 'relevant details'],
-                'output_structure': ['overview', 'main_points', 'details', 'summary']
-            }
-        }
-        
         # Try to match persona to patterns
         persona_lower = self.persona.lower()
-        for pattern_key in patterns.keys():
+        for pattern_key in _PATTERNS.keys():
             if any(keyword in persona_lower for keyword in pattern_key.split('_')):
-                return patterns[pattern_key]
-        
-        return patterns['default']
+                return _PATTERNS[pattern_key]
+
+        return _PATTERNS['default']
     
     def analyze_documents(self, documents: List[Dict[str, Any]]) -> Dict[str, Any]:
         """
@@ -83,10 +284,25 @@ class PersonaAnalyzer:
             'recommendations': []
         }
         
-        # Analyze each document
-        for doc in documents:
-            doc_analysis = self.analyze_single_document(doc)
-            analysis_results['document_analyses'].append(doc_analysis)
+        # Analyze each document; per-document analysis is independent and
+        # CPU-bound, so fan out across cores for larger collections. Worker
+        # count can be pinned via ANALYZE_DOCUMENTS_NUMBER_OF_PROCESSES.
+        max_workers = int(os.environ.get('ANALYZE_DOCUMENTS_NUMBER_OF_PROCESSES', 0)) or os.cpu_count()
+        max_workers = min(max_workers, len(documents))
+
+        if len(documents) > 1 and max_workers > 1:
+            ctx = mp.get_context('fork') if 'fork' in mp.get_all_start_methods() else None
+            with ProcessPoolExecutor(
+                    max_workers=max_workers, mp_context=ctx,
+                    initializer=_init_analyzer_worker,
+                    initargs=(self.persona, self.job_to_be_done, str(self.output_folder))
+            ) as executor:
+                analysis_results['document_analyses'] = list(
+                    executor.map(_analyze_document_worker, documents, chunksize=4))
+        else:
+            for doc in documents:
+                doc_analysis = self.analyze_single_document(doc)
+                analysis_results['document_analyses'].append(doc_analysis)
         
         # Generate consolidated insights
         analysis_results['consolidated_insights'] = self.generate_consolidated_insights(documents)
@@ -106,59 +322,121 @@ class PersonaAnalyzer:
         """Analyze a single document from the persona's perspective."""
         filename = document.get('metadata', {}).get('filename', 'Unknown')
         content = document.get('content', '')
+        content_lower = _content_lower_of(document)
         sections = document.get('sections', [])
-        
+
         print(f"Analyzing: {filename}")
-        
+
+        # Tokenize every section title once up front; downstream helpers
+        # read the cached tokens instead of re-splitting
+        for section in sections:
+            _title_tokens_of(section)
+
         doc_analysis = {
             'filename': filename,
-            'relevance_score': self.calculate_relevance_score(content),
+            'relevance_score': self._relevance_from_hits(self._keyword_hits(document)),
             'key_extracts': self.extract_key_information(content),
             'relevant_sections': self.identify_relevant_sections(sections),
-            'persona_insights': self.generate_persona_insights(content),
+            'persona_insights': self.generate_persona_insights(content, content_lower),
             'actionable_items': self.extract_actionable_items(content)
         }
         
         return doc_analysis
     
-    def calculate_relevance_score(self, content: str) -> float:
-        """Calculate how relevant the document is to the persona and job."""
-        content_lower = content.lower()
-        job_lower = self.job_to_be_done.lower()
-        
-        # Count matches with job keywords
-        job_keywords = re.findall(r'\b\w+\b', job_lower)
-        job_matches = sum(1 for keyword in job_keywords if keyword in content_lower)
-        
-        # Count matches with persona-specific keywords
-        persona_keywords = self.analysis_patterns['extraction_keywords']
-        persona_matches = sum(1 for keyword in persona_keywords if keyword in content_lower)
-        
-        # Calculate relevance score (0-1)
-        total_possible = len(job_keywords) + len(persona_keywords)
-        total_matches = job_matches + persona_matches
-        
+    def _keyword_hits(self, doc: Dict[str, Any]) -> frozenset:
+        """Job/persona keywords present in the document, cached on the dict.
+
+        Memoized so the per-document scoring pass and the consolidated pass
+        scan each document's tokens once between them. The cache is keyed to
+        this analyzer's keyword sets, which are fixed for its lifetime.
+        """
+        hits = doc.get('_kw_hits')
+        if hits is None:
+            wanted = self._job_kw_set | self._persona_kw_set
+            hits = doc['_kw_hits'] = frozenset(
+                wanted & set(_content_norm_of(doc).split()))
+        return hits
+
+    def _relevance_from_hits(self, hits) -> float:
+        """Final 0-1 relevance score from a set of matched keywords."""
+        total_possible = len(self._job_kw_set) + len(self._persona_kw_set)
+        total_matches = (len(self._job_kw_set & hits)
+                         + len(self._persona_kw_set & hits))
+
         relevance_score = min(total_matches / total_possible, 1.0) if total_possible > 0 else 0.0
-        
+
         return round(relevance_score, 3)
-    
+
+    def calculate_relevance_score(self, content: str, content_norm: str = None) -> float:
+        """Calculate how relevant the document is to the persona and job."""
+        # Tokenize once and count matches as C-level set intersections;
+        # keywords match whole words rather than substrings of them. The
+        # normalized buffer makes tokenization a plain split, so build one
+        # here when the caller didn't pass it
+        if content_norm is None:
+            content_norm = content.translate(_NORM_TABLE)
+        content_tokens = set(content_norm.split())
+
+        return self._relevance_from_hits(
+            (self._job_kw_set | self._persona_kw_set) & content_tokens)
+
+    def calculate_corpus_relevance(self, documents: List[Dict[str, Any]]) -> float:
+        """Relevance of the whole collection, streamed one document at a time.
+
+        Reuses each document's cached keyword hits instead of scoring a
+        concatenation of every document's text.
+        """
+        wanted = self._job_kw_set | self._persona_kw_set
+
+        hits = set()
+        for doc in documents:
+            hits |= self._keyword_hits(doc)
+            if len(hits) == len(wanted):
+                break
+
+        return self._relevance_from_hits(hits)
+
     def extract_key_information(self, content: str) -> List[str]:
         """Extract key information based on persona needs."""
         key_extracts = []
-        sentences = re.split(r'[.!?]+', content)
-        
+        sentences = _SENT_RE.split(content)
+
         keywords = self.analysis_patterns['extraction_keywords']
-        
+
+        if HAVE_NUMBA and len(content) > _NUMBA_MIN_TEXT and content.isascii():
+            # One kernel call scans every candidate sentence against every
+            # keyword without touching the interpreter per sentence
+            candidates = [s for s in (x.strip() for x in sentences) if len(s) > 20]
+            if not candidates:
+                return []
+            mask = _sentence_keyword_mask(candidates, keywords)
+            seen = set()
+            for sentence, hit in zip(candidates, mask):
+                if hit and sentence not in seen:
+                    seen.add(sentence)
+                    key_extracts.append(sentence)
+                    if len(key_extracts) == 10:
+                        break
+            return key_extracts
+
+        seen = set()
         for sentence in sentences:
             sentence = sentence.strip()
-            if len(sentence) > 20:  # Skip very short sentences
+            if len(sentence) > 20 and sentence not in seen:  # Skip short/repeated sentences
                 # Check if sentence contains relevant keywords
                 sentence_lower = sentence.lower()
-                if any(keyword in sentence_lower for keyword in keywords):
+                if self._extract_ac is not None:
+                    matched = next(self._extract_ac.iter(sentence_lower), None) is not None
+                else:
+                    matched = any(keyword in sentence_lower for keyword in keywords)
+                if matched:
+                    seen.add(sentence)
                     key_extracts.append(sentence)
-        
-        # Return top extracts (limit to avoid overwhelming output)
-        return key_extracts[:10]
+                    # Stop once the quota is full instead of scanning the rest
+                    if len(key_extracts) == 10:
+                        break
+
+        return key_extracts
     
     def identify_relevant_sections(self, sections: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Identify sections most relevant to the persona."""
@@ -168,86 +446,108 @@ class PersonaAnalyzer:
         for section in sections:
             title = section.get('title', '').lower()
             content = section.get('content', '').lower()
-            
-            # Check if section is relevant
-            relevance_score = 0
-            for keyword in key_section_keywords:
-                if keyword in title or keyword in content:
-                    relevance_score += 1
+
+            # Check if section is relevant; one automaton pass over
+            # title+content counts the distinct keywords present
+            if self._section_ac is not None:
+                relevance_score = len(
+                    {word for _, word in self._section_ac.iter(title + '\n' + content)})
+            else:
+                relevance_score = 0
+                for keyword in key_section_keywords:
+                    if keyword in title or keyword in content:
+                        relevance_score += 1
             
             if relevance_score > 0:
-                relevant_section = section.copy()
+                # Copy without the underscore-prefixed token caches so they
+                # never leak into the serialized analysis output
+                relevant_section = {k: v for k, v in section.items()
+                                    if not k.startswith('_')}
                 relevant_section['relevance_score'] = relevance_score
                 relevant_sections.append(relevant_section)
-        
-        # Sort by relevance
-        relevant_sections.sort(key=lambda x: x.get('relevance_score', 0), reverse=True)
-        
-        return relevant_sections[:5]  # Return top 5 most relevant sections
+
+        if not relevant_sections:
+            return []
+
+        # Top 5 by relevance: argpartition picks the winners in O(N), then
+        # only those few are ordered (score descending, index as tie-break)
+        scores = np.fromiter((s['relevance_score'] for s in relevant_sections),
+                             dtype=np.int32, count=len(relevant_sections))
+        k = min(5, len(scores))
+        top_idx = np.argpartition(-scores, k - 1)[:k]
+        top_idx = top_idx[np.lexsort((top_idx, -scores[top_idx]))]
+
+        return [relevant_sections[i] for i in top_idx]
     
-    def generate_persona_insights(self, content: str) -> List[str]:
-        """Generate insights specific to the persona's perspective."""
-        insights = []
-        content_lower = content.lower()
-        
+    def _build_insight_rules(self) -> List[Tuple[Tuple[str, ...], str]]:
+        """Resolve the persona branch once into (trigger words, insight) rules.
+
+        generate_persona_insights then only scans the rules that apply to this
+        analyzer's persona instead of re-evaluating every persona test per
+        document.
+        """
+        persona_lower = self.persona.lower()
+
         # Travel Content Writer specific insights
-        if 'travel' in self.persona.lower() or 'writer' in self.persona.lower():
-            if 'restaurant' in content_lower or 'food' in content_lower:
-                insights.append("Rich culinary content available for food section")
-            if 'history' in content_lower or 'culture' in content_lower:
-                insights.append("Cultural and historical context for authentic storytelling")
-            if 'tip' in content_lower or 'recommend' in content_lower:
-                insights.append("Practical travel tips and recommendations identified")
-        
+        if 'travel' in persona_lower or 'writer' in persona_lower:
+            return [
+                (('restaurant', 'food'), "Rich culinary content available for food section"),
+                (('history', 'culture'), "Cultural and historical context for authentic storytelling"),
+                (('tip', 'recommend'), "Practical travel tips and recommendations identified"),
+            ]
+
         # Researcher specific insights
-        elif 'research' in self.persona.lower() or 'phd' in self.persona.lower():
-            if 'method' in content_lower or 'study' in content_lower:
-                insights.append("Methodological information available")
-            if 'data' in content_lower or 'result' in content_lower:
-                insights.append("Data and results section identified")
-        
+        if 'research' in persona_lower or 'phd' in persona_lower:
+            return [
+                (('method', 'study'), "Methodological information available"),
+                (('data', 'result'), "Data and results section identified"),
+            ]
+
         # Analyst specific insights
-        elif 'analyst' in self.persona.lower():
-            if any(word in content_lower for word in ['trend', 'growth', 'market', 'revenue']):
-                insights.append("Market and trend information available")
-            if any(word in content_lower for word in ['percent', '%', 'increase', 'decrease']):
-                insights.append("Quantitative data points identified")
-        
+        if 'analyst' in persona_lower:
+            return [
+                (('trend', 'growth', 'market', 'revenue'), "Market and trend information available"),
+                (('percent', '%', 'increase', 'decrease'), "Quantitative data points identified"),
+            ]
+
+        return []
+
+    def generate_persona_insights(self, content: str, content_lower: str = None) -> List[str]:
+        """Generate insights specific to the persona's perspective."""
+        if content_lower is None:
+            content_lower = content.lower()
+
+        insights = [insight for triggers, insight in self._insight_rules
+                    if any(word in content_lower for word in triggers)]
+
         # Generic insights if no specific persona match
         if not insights:
             insights.append("Content contains relevant information for specified job")
-        
+
         return insights
     
     def extract_actionable_items(self, content: str) -> List[str]:
         """Extract actionable items based on the job-to-be-done."""
         actionable_items = []
-        sentences = re.split(r'[.!?]+', content)
-        
-        # Look for imperative sentences or recommendations
-        action_patterns = [
-            r'\b(should|must|need to|recommended|suggest|advise)\b.*',
-            r'\b(visit|try|taste|see|do|avoid|bring|book)\b.*',
-            r'\b(tip|advice|recommendation|warning)\b.*'
-        ]
-        
-        for sentence in sentences:
+        seen = set()
+
+        # Look for imperative sentences or recommendations, stopping once the
+        # quota is met and skipping repeated sentences
+        for sentence in _SENT_RE.split(content):
             sentence = sentence.strip()
-            if len(sentence) > 15:
-                for pattern in action_patterns:
-                    if re.search(pattern, sentence, re.IGNORECASE):
-                        actionable_items.append(sentence)
-                        break
-        
-        return actionable_items[:8]  # Limit to top actionable items
+            if len(sentence) > 15 and sentence not in seen and _ACTION_RE.search(sentence):
+                seen.add(sentence)
+                actionable_items.append(sentence)
+                if len(actionable_items) == 8:
+                    break
+
+        return actionable_items
     
     def generate_consolidated_insights(self, documents: List[Dict[str, Any]]) -> Dict[str, Any]:
         """Generate insights across all documents."""
-        all_content = " ".join([doc.get('content', '') for doc in documents])
-        
         consolidated = {
             'total_documents_analyzed': len(documents),
-            'overall_relevance': self.calculate_relevance_score(all_content),
+            'overall_relevance': self.calculate_corpus_relevance(documents),
             'key_themes': self.extract_key_themes(documents),
             'content_gaps': self.identify_content_gaps(documents),
             'cross_document_patterns': self.find_cross_document_patterns(documents)
@@ -257,114 +557,178 @@ class PersonaAnalyzer:
     
     def extract_key_themes(self, documents: List[Dict[str, Any]]) -> List[str]:
         """Extract recurring themes across documents."""
-        all_sections = []
+        # Map each qualifying title word to a dense id; counting then becomes
+        # one bincount over the id array instead of per-word dict increments
+        vocab = {}
+        ids = []
         for doc in documents:
-            sections = doc.get('sections', [])
-            all_sections.extend([s.get('title', '').lower() for s in sections])
-        
-        # Count theme frequency
-        theme_counts = {}
-        for section_title in all_sections:
-            words = re.findall(r'\b\w+\b', section_title)
-            for word in words:
-                if len(word) > 3:
-                    theme_counts[word] = theme_counts.get(word, 0) + 1
-        
-        # Get top themes
-        top_themes = sorted(theme_counts.items(), key=lambda x: x[1], reverse=True)[:10]
-        return [theme for theme, count in top_themes if count > 1]
+            for section in doc.get('sections', []):
+                for word in _title_tokens_of(section):
+                    if len(word) > 3:
+                        ids.append(vocab.setdefault(word, len(vocab)))
+
+        if not ids:
+            return []
+
+        counts = np.bincount(np.asarray(ids, dtype=np.int64), minlength=len(vocab))
+
+        # Get top themes; stable sort keeps first-seen order on ties like the
+        # old sorted() did
+        top = np.argsort(-counts, kind='stable')[:10]
+        words = list(vocab)
+        return [words[i] for i in top if counts[i] > 1]
     
     def identify_content_gaps(self, documents: List[Dict[str, Any]]) -> List[str]:
         """Identify potential gaps in content for the job-to-be-done."""
         gaps = []
         job_lower = self.job_to_be_done.lower()
-        all_content = " ".join([doc.get('content', '') for doc in documents]).lower()
-        
-        # Check for common travel guide elements if it's a travel-related job
+
+        # Terms whose absence would be a gap
+        travel_elements = []
         if 'travel' in job_lower or 'guide' in job_lower:
             travel_elements = ['transportation', 'budget', 'weather', 'language', 'currency', 'safety']
-            for element in travel_elements:
-                if element not in all_content:
-                    gaps.append(f"Missing {element} information")
-        
-        # Check for job-specific requirements
-        job_keywords = re.findall(r'\b\w+\b', job_lower)
+        job_keywords = [k for k in self.job_to_be_done.translate(_NORM_TABLE).split() if len(k) > 3]
+
+        # Stream the documents, dropping terms as soon as one covers them --
+        # no concatenated megastring, and an early exit once nothing is missing
+        missing = set(travel_elements).union(job_keywords)
+        for doc in documents:
+            if not missing:
+                break
+            content_lower = _content_lower_of(doc)
+            missing = {term for term in missing if term not in content_lower}
+
+        for element in travel_elements:
+            if element in missing:
+                gaps.append(f"Missing {element} information")
         for keyword in job_keywords:
-            if keyword not in all_content and len(keyword) > 3:
+            if keyword in missing:
                 gaps.append(f"Limited coverage of {keyword}")
-        
+
         return gaps[:5]  # Limit to top gaps
     
     def find_cross_document_patterns(self, documents: List[Dict[str, Any]]) -> List[str]:
         """Find patterns that appear across multiple documents."""
-        patterns = []
-        
-        # Look for repeated phrases or concepts
-        all_contents = [doc.get('content', '') for doc in documents]
-        
-        # Simple pattern: check for phrases that appear in multiple documents
-        common_phrases = {}
-        for content in all_contents:
-            # Extract phrases of 2-4 words
-            words = re.findall(r'\b\w+\b', content.lower())
-            for i in range(len(words) - 1):
-                phrase = ' '.join(words[i:i+2])
-                if len(phrase) > 6:  # Skip very short phrases
-                    common_phrases[phrase] = common_phrases.get(phrase, 0) + 1
-        
+        # Count, for each bigram, how many documents it appears in:
+        # dict.fromkeys deduplicates repeats within a document while keeping
+        # first-occurrence order, so the tally reflects cross-document
+        # presence and ties come out in a stable, hash-seed-independent order
+        bigram_docs = Counter()
+        for doc in documents:
+            words = _content_norm_of(doc).split()
+            bigram_docs.update(dict.fromkeys(zip(words, words[1:])).keys())
+
         # Find phrases that appear in multiple documents
-        cross_doc_phrases = [(phrase, count) for phrase, count in common_phrases.items() if count >= min(2, len(documents))]
-        cross_doc_phrases.sort(key=lambda x: x[1], reverse=True)
-        
-        patterns = [f"'{phrase}' appears across multiple documents" for phrase, count in cross_doc_phrases[:5]]
-        
+        threshold = min(2, len(documents))
+        patterns = []
+        for (first, second), count in bigram_docs.most_common():
+            if count < threshold:
+                break
+            phrase = f"{first} {second}"
+            if len(phrase) > 6:  # Skip very short phrases
+                patterns.append(f"'{phrase}' appears across multiple documents")
+                if len(patterns) == 5:
+                    break
+
         return patterns
     
+    def _build_category_tagger(self, categories):
+        """Build one automaton whose hits carry category tags, or None.
+
+        One pass over a section's text then yields every matching category
+        instead of a scan per (section, category) pair.
+        """
+        if not HAVE_AHOCORASICK:
+            return None
+        tagged = {}
+        for category in categories:
+            for keyword in _CATEGORY_KEYWORDS.get(category, (category,)):
+                tagged.setdefault(keyword, set()).add(category)
+        if not tagged:
+            return None
+        automaton = ahocorasick.Automaton()
+        for keyword, cats in tagged.items():
+            automaton.add_word(keyword, frozenset(cats))
+        automaton.make_automaton()
+        return automaton
+
     def extract_persona_specific_info(self, documents: List[Dict[str, Any]]) -> Dict[str, Any]:
         """Extract information specifically organized for the persona."""
         structure = self.analysis_patterns['output_structure']
         persona_extracts = {}
-        
+
         for category in structure:
             persona_extracts[category] = []
-        
+
         # Extract information into persona-specific categories
         for doc in documents:
-            content = doc.get('content', '')
+            source = doc.get('metadata', {}).get('filename', 'Unknown')
             sections = doc.get('sections', [])
-            
+
             # Categorize content based on persona needs
             for section in sections:
                 title = section.get('title', '').lower()
                 section_content = section.get('content', '')
-                
-                # Map sections to persona categories
+
+                # Titles that name their category resolve without touching
+                # the section content at all
+                _title_tokens_of(section)
+                title_set = section['_title_set']
+                matched = {category for category in structure
+                           if title_set & _CATEGORY_KW_SETS.get(category, frozenset())}
+
+                # Tag the remaining categories in a single pass over the text
+                if len(matched) < len(structure):
+                    if self._category_tag_ac is not None:
+                        text = title + " " + section_content.lower()
+                        for _, cats in self._category_tag_ac.iter(text):
+                            matched |= cats
+                            if len(matched) == len(structure):
+                                break
+                    else:
+                        matched |= {category for category in structure
+                                    if category not in matched
+                                    and self.matches_category(title, section_content, category,
+                                                              title_set=title_set)}
+
+                if not matched:
+                    continue
+
+                # One shared entry dict serves every matched category
+                entry = {
+                    'source': source,
+                    'title': section.get('title', ''),
+                    'content': section_content[:500] + "..." if len(section_content) > 500 else section_content
+                }
                 for category in structure:
-                    if self.matches_category(title, section_content, category):
-                        persona_extracts[category].append({
-                            'source': doc.get('metadata', {}).get('filename', 'Unknown'),
-                            'title': section.get('title', ''),
-                            'content': section_content[:500] + "..." if len(section_content) > 500 else section_content
-                        })
-        
+                    if category in matched:
+                        persona_extracts[category].append(entry)
+
         return persona_extracts
-    
-    def matches_category(self, title: str, content: str, category: str) -> bool:
-        """Check if content matches a persona-specific category."""
+
+    def matches_category(self, title: str, content: str, category: str,
+                         title_set: frozenset = None) -> bool:
+        """Check if content matches a persona-specific category.
+
+        A title token equal to a category keyword settles the answer without
+        scanning the section content; the full substring scan runs only when
+        the title alone is inconclusive.
+        """
+        keywords = _CATEGORY_KEYWORDS.get(category, (category,))
+
+        if title_set is None:
+            title_set = frozenset(title.translate(_NORM_TABLE).split())
+        if title_set & _CATEGORY_KW_SETS.get(category, frozenset(keywords)):
+            return True
+
         text = (title + " " + content).lower()
-        
-        category_keywords = {
-            'overview': ['overview', 'introduction', 'about', 'general'],
-            'attractions': ['attraction', 'visit', 'see', 'place', 'site', 'landmark'],
-            'dining': ['restaurant', 'food', 'eat', 'cuisine', 'dining', 'taste'],
-            'culture': ['culture', 'tradition', 'history', 'local', 'heritage'],
-            'practical_tips': ['tip', 'advice', 'recommend', 'should', 'how to'],
-            'main_points': ['important', 'key', 'main', 'primary'],
-            'details': ['detail', 'specific', 'information', 'data'],
-            'summary': ['summary', 'conclusion', 'overview', 'recap']
-        }
-        
-        keywords = category_keywords.get(category, [category])
+
+        if HAVE_AHOCORASICK:
+            automaton = self._category_acs.get(category)
+            if automaton is None:
+                automaton = self._category_acs[category] = _build_automaton(keywords)
+            return next(automaton.iter(text), None) is not None
+
         return any(keyword in text for keyword in keywords)
     
     def generate_recommendations(self, documents: List[Dict[str, Any]]) -> List[str]:
@@ -403,8 +767,12 @@ class PersonaAnalyzer:
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         output_file = self.output_folder / f"persona_analysis_{timestamp}.json"
         
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(analysis_results, f, indent=2, ensure_ascii=False)
+        if HAVE_ORJSON:
+            # orjson serializes in C and writes UTF-8 bytes directly
+            output_file.write_bytes(orjson.dumps(analysis_results, option=orjson.OPT_INDENT_2))
+        else:
+            with open(output_file, 'w', encoding='utf-8') as f:
+                json.dump(analysis_results, f, indent=2, ensure_ascii=False)
         
         print(f"Analysis results saved to: {output_file}")
         
@@ -414,34 +782,38 @@ class PersonaAnalyzer:
     def create_readable_summary(self, analysis_results: Dict[str, Any], timestamp: str):
         """Create a human-readable summary of the analysis."""
         summary_file = self.output_folder / f"analysis_summary_{timestamp}.txt"
-        
-        with open(summary_file, 'w', encoding='utf-8') as f:
-            f.write("=" * 60 + "\n")
-            f.write("PERSONA-DRIVEN DOCUMENT ANALYSIS SUMMARY\n")
-            f.write("=" * 60 + "\n\n")
-            
-            f.write(f"Persona: {analysis_results['persona']}\n")
-            f.write(f"Job to be Done: {analysis_results['job_to_be_done']}\n")
-            f.write(f"Analysis Date: {analysis_results['analysis_timestamp']}\n\n")
-            
-            f.write("CONSOLIDATED INSIGHTS:\n")
-            f.write("-" * 30 + "\n")
-            insights = analysis_results.get('consolidated_insights', {})
-            f.write(f"Documents Analyzed: {insights.get('total_documents_analyzed', 0)}\n")
-            f.write(f"Overall Relevance Score: {insights.get('overall_relevance', 0):.3f}\n")
-            f.write(f"Key Themes: {', '.join(insights.get('key_themes', []))}\n\n")
-            
-            f.write("DOCUMENT ANALYSIS:\n")
-            f.write("-" * 20 + "\n")
-            for doc_analysis in analysis_results.get('document_analyses', []):
-                f.write(f"• {doc_analysis.get('filename', 'Unknown')}\n")
-                f.write(f"  Relevance Score: {doc_analysis.get('relevance_score', 0):.3f}\n")
-                f.write(f"  Key Insights: {len(doc_analysis.get('persona_insights', []))}\n")
-                f.write(f"  Actionable Items: {len(doc_analysis.get('actionable_items', []))}\n\n")
-            
-            f.write("RECOMMENDATIONS:\n")
-            f.write("-" * 20 + "\n")
-            for rec in analysis_results.get('recommendations', []):
-                f.write(f"• {rec}\n")
-        
+
+        # Assemble the summary in memory and write it in one call instead of
+        # issuing dozens of tiny writes
+        parts = []
+        parts.append("=" * 60 + "\n")
+        parts.append("PERSONA-DRIVEN DOCUMENT ANALYSIS SUMMARY\n")
+        parts.append("=" * 60 + "\n\n")
+
+        parts.append(f"Persona: {analysis_results['persona']}\n")
+        parts.append(f"Job to be Done: {analysis_results['job_to_be_done']}\n")
+        parts.append(f"Analysis Date: {analysis_results['analysis_timestamp']}\n\n")
+
+        parts.append("CONSOLIDATED INSIGHTS:\n")
+        parts.append("-" * 30 + "\n")
+        insights = analysis_results.get('consolidated_insights', {})
+        parts.append(f"Documents Analyzed: {insights.get('total_documents_analyzed', 0)}\n")
+        parts.append(f"Overall Relevance Score: {insights.get('overall_relevance', 0):.3f}\n")
+        parts.append(f"Key Themes: {', '.join(insights.get('key_themes', []))}\n\n")
+
+        parts.append("DOCUMENT ANALYSIS:\n")
+        parts.append("-" * 20 + "\n")
+        for doc_analysis in analysis_results.get('document_analyses', []):
+            parts.append(f"• {doc_analysis.get('filename', 'Unknown')}\n")
+            parts.append(f"  Relevance Score: {doc_analysis.get('relevance_score', 0):.3f}\n")
+            parts.append(f"  Key Insights: {len(doc_analysis.get('persona_insights', []))}\n")
+            parts.append(f"  Actionable Items: {len(doc_analysis.get('actionable_items', []))}\n\n")
+
+        parts.append("RECOMMENDATIONS:\n")
+        parts.append("-" * 20 + "\n")
+        for rec in analysis_results.get('recommendations', []):
+            parts.append(f"• {rec}\n")
+
+        summary_file.write_text(''.join(parts), encoding='utf-8')
+
         print(f"Readable summary saved to: {summary_file}")
\ No newline at end of file